@@ -1,16 +1,46 @@
+import numpy as np
 import pandas as pd
+import matplotlib
+# Non-interactive backend: the script only writes PNGs, so skip GUI toolkit init
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 import glob
+import itertools
+import multiprocessing
 import os
 import platform
+from concurrent.futures import ProcessPoolExecutor
 import json # New import
 
+# PyArrow gives a faster CSV parser; fall back to the default C parser if missing
+try:
+    import pyarrow
+    import pyarrow.csv
+    CSV_READ_OPTIONS = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+except ImportError:
+    pyarrow = None
+    CSV_READ_OPTIONS = {}
+
+# Numba JIT-compiles the group-sum kernel; fall back to plain NumPy if missing
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# orjson serializes the dashboard export much faster; fall back to json if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Font configuration
 import matplotlib.font_manager as fm
 
+system_name = platform.system()
+
 # Try to set Pretendard if available, else fallback
-fonts = [f.name for f in fm.fontManager.ttflist]
+fonts = {f.name for f in fm.fontManager.ttflist}
 if 'Pretendard' in fonts:
     plt.rc('font', family='Pretendard')
 elif 'Pretendard JP' in fonts:
@@ -26,16 +56,62 @@ else:
 
 plt.rc('axes', unicode_minus=False)
 
+def _new_figure(figsize):
+    # Reuse one Figure per process: clear and resize it instead of creating a new one per plot
+    fig = plt.figure(num='analysis')
+    fig.clf()
+    fig.set_size_inches(figsize)
+    return fig
+
+# 150 dpi is still sharp at dashboard sizes; zlib level 1 cuts PNG compression time several-fold
+SAVEFIG_OPTIONS = {'dpi': 150, 'pil_kwargs': {'compress_level': 1}}
+
+# Exclude metadata AND aggregate columns to prevent double counting
+EXCLUDE_COLS = frozenset(['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중'])
+
+# Group-sum kernel: out[k, j] += values[i, j] where codes[i] == k
+# out is allocated by the caller so the accumulator can be wider than the input
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _grouped_sum(codes, values, out):
+        # Parallel over columns so no two threads write the same cell
+        for j in numba.prange(values.shape[1]):
+            for i in range(values.shape[0]):
+                out[codes[i], j] += values[i, j]
+        return out
+else:
+    def _grouped_sum(codes, values, out):
+        np.add.at(out, codes, values)
+        return out
+
+def sum_by(df, key, value_cols, sort=False):
+    # Equivalent to df.groupby(key, sort=sort, observed=True)[value_cols].sum()
+    # for a single key column. Keys come out in order of appearance unless sort=True;
+    # most callers re-sort by value anyway.
+    codes, uniques = pd.factorize(df[key], sort=sort)
+    values = np.ascontiguousarray(df[value_cols].to_numpy())
+    # Rows with a missing key are dropped, as groupby does
+    keep = codes >= 0
+    if not keep.all():
+        codes, values = codes[keep], values[keep]
+    if len(codes) == 0:
+        return df.groupby(key, sort=sort, observed=True)[value_cols].sum()
+    # Accumulate floats in float64: a float32 running sum drifts badly over many rows
+    acc_dtype = np.float64 if values.dtype.kind == 'f' else values.dtype
+    sums = _grouped_sum(codes, values, np.zeros((len(uniques), values.shape[1]), dtype=acc_dtype))
+    result = pd.DataFrame(sums, index=pd.Index(uniques, name=key), columns=value_cols)
+    # Cast back per column: to_numpy() upcasts a mixed int/float block to float64
+    return result.astype(df[value_cols].dtypes.to_dict())
+
 def load_and_merge_data(file_patterns):
-    files = []
-    for pattern in file_patterns:
-        files.extend(glob.glob(pattern))
+    # Overlapping patterns can match the same file twice
+    files = sorted(set(itertools.chain.from_iterable(glob.glob(p) for p in file_patterns)))
     
     dfs = []
     for f in files:
         try:
             # Renewable energy data usually comes in cp949 or euc-kr
-            df = pd.read_csv(f, encoding='cp949') 
+            df = pd.read_csv(f, encoding='cp949', **CSV_READ_OPTIONS)
             dfs.append(df)
             print(f"Loaded {f} with shape {df.shape}")
         except Exception as e:
@@ -44,6 +120,9 @@ def load_and_merge_data(file_patterns):
     if not dfs:
         raise ValueError("No files loaded.")
     
+    # Single concat over all frames; skip it entirely for a single file
+    if len(dfs) == 1:
+        return dfs[0]
     combined_df = pd.concat(dfs, ignore_index=True)
     return combined_df
 
@@ -53,42 +132,43 @@ def clean_data(df):
     # Filter for Incheon (assuming column '광역지자체' exists based on preview)
     # The snippet showed '광역지자체'
     if '광역지자체' in df.columns:
-        df_incheon = df[df['광역지자체'] == '인천'].copy()
+        # Build a fresh frame from masked column arrays: it owns its data (no SettingWithCopy)
+        # without the filter-then-copy double allocation, and keeps the pyarrow dtypes
+        mask = (df['광역지자체'] == '인천').to_numpy(dtype=bool, na_value=False)
+        df_incheon = pd.DataFrame({c: df[c].array[mask] for c in df.columns})
     else:
         print("Warning: '광역지자체' column not found. Using full dataset.")
         df_incheon = df.copy()
 
+    # Region columns hold a handful of repeated strings: categorical codes are far
+    # smaller and make every groupby/factorize on them an integer lookup
+    for col in ('광역지자체', '기초지자체'):
+        if col in df_incheon.columns:
+            df_incheon[col] = df_incheon[col].astype('category')
+
     # Numeric conversion
     # Columns typically: 연도, 광역지자체, 기초지자체, 태양광, 풍력, etc.
     # Values often have commas like "1,234" or "-" for 0/NaN.
     
     # Identify value columns (exclude metadata columns)
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
-    for col in value_cols:
-        # Remove commas and handle '-'
-        df_incheon[col] = df_incheon[col].astype(str).str.replace(',', '').str.strip()
-        df_incheon[col] = df_incheon[col].replace(['-', ''], '0')
-        # Convert to float
-        df_incheon[col] = pd.to_numeric(df_incheon[col], errors='coerce').fillna(0)
-            
-    return df_incheon
+    # Computed once here and passed to every plot function
+    value_cols = [c for c in df.columns if c not in EXCLUDE_COLS]
+    
+    # Clean the whole value block in one pass instead of column by column
+    block = df_incheon[value_cols].astype(str)
+    # Remove commas and handle '-'
+    block = block.apply(lambda s: s.str.replace(',', '', regex=False).str.strip())
+    block = block.replace({'-': '0', '': '0'})
+    # Convert to float32: generation figures fit easily and it halves the bytes every sum touches
+    df_incheon[value_cols] = block.apply(pd.to_numeric, errors='coerce').fillna(0).astype(np.float32)
 
-def plot_yearly_trend(df):
-    # Sum all energy sources by year
-    # Assuming '합계' column might exist, or we sum all value columns
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
-    # Group by Year
-    yearly_sum = df.groupby('연도')[value_cols].sum().sum(axis=1).reset_index(name='Total_Generation')
+    return df_incheon, value_cols
+
+def plot_yearly_trend(yearly_total):
+    # yearly_total: all energy sources summed per Year
+    yearly_sum = yearly_total.reset_index(name='Total_Generation')
     
-    plt.figure(figsize=(10, 6))
+    _new_figure((10, 6))
     
     # Ensure years are sorted
     yearly_sum = yearly_sum.sort_values('연도')
@@ -99,10 +179,13 @@ def plot_yearly_trend(df):
     # Force integer ticks for years
     plt.xticks(yearly_sum['연도'].astype(int))
     
-    # Add value labels
-    # Add value labels
-    for x, y in zip(yearly_sum['연도'], yearly_sum['Total_Generation']):
-        plt.text(x, y + (y*0.02), f'{y:,.0f}', ha='center', va='bottom', fontsize=16, fontweight='bold')
+    # Add value labels (strings and positions computed up front, drawn on the axes directly)
+    ax = plt.gca()
+    years = yearly_sum['연도'].to_numpy()
+    totals = yearly_sum['Total_Generation'].to_numpy()
+    labels = [f'{y:,.0f}' for y in totals]
+    for x, y, label in zip(years, totals * 1.02, labels):
+        ax.annotate(label, (x, y), ha='center', va='bottom', fontsize=16, fontweight='bold')
 
     plt.title('인천시 연도별 신재생에너지 총 발전량 추이', fontsize=24, pad=20, fontweight='bold')
     plt.xlabel('연도', fontsize=16, fontweight='bold')
@@ -111,21 +194,13 @@ def plot_yearly_trend(df):
     plt.yticks(fontsize=14)
     plt.grid(True, linestyle='--', alpha=0.5)
     plt.tight_layout()
-    plt.savefig('yearly_trend.png', dpi=300)
+    plt.savefig('yearly_trend.png', **SAVEFIG_OPTIONS)
     print("Saved yearly_trend.png")
 
-def plot_yearly_trend_by_source(df):
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
-    # Group by Year and Source (melt or simple sum)
-    yearly_source = df.groupby('연도')[value_cols].sum()
-    yearly_source = yearly_source.sort_index() # Sort by Year
-    
-    plt.figure(figsize=(12, 7))
-    yearly_source.plot(kind='area', stacked=True, colormap='tab20', alpha=0.8, figsize=(12, 7))
+def plot_yearly_trend_by_source(yearly_source):
+    # yearly_source: Year x Source sums, already sorted by Year
+    _new_figure((12, 7))
+    yearly_source.plot(kind='area', stacked=True, colormap='tab20', alpha=0.8, ax=plt.gca())
     
     plt.xticks(yearly_source.index.astype(int), fontsize=14) # Integer ticks
     plt.yticks(fontsize=14)
@@ -136,52 +211,36 @@ def plot_yearly_trend_by_source(df):
     plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=14)
     plt.grid(True, linestyle='--', alpha=0.5)
     plt.tight_layout()
-    plt.savefig('yearly_trend_by_source.png', dpi=300)
+    plt.savefig('yearly_trend_by_source.png', **SAVEFIG_OPTIONS)
     print("Saved yearly_trend_by_source.png")
 
-def plot_regional_comparison(df):
+def plot_regional_comparison(regional_source, latest_year):
     # Latest year only for comparison
-    latest_year = df['연도'].max()
-    df_latest = df[df['연도'] == latest_year]
-    
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
-    # Group by Region (Gun/Gu)
-    regional_sum = df_latest.groupby('기초지자체')[value_cols].sum().sum(axis=1).reset_index(name='Total_Generation')
+    # Total per Region (Gun/Gu)
+    regional_sum = regional_source.sum(axis=1).reset_index(name='Total_Generation')
     regional_sum = regional_sum.sort_values('Total_Generation', ascending=False)
     
-    plt.figure(figsize=(12, 6))
-    sns.barplot(data=regional_sum, x='기초지자체', y='Total_Generation', palette='viridis')
+    _new_figure((12, 6))
+    # Explicit order: seaborn would otherwise draw categorical x in category order
+    sns.barplot(data=regional_sum, x='기초지자체', y='Total_Generation', order=regional_sum['기초지자체'], palette='viridis')
     plt.title(f'인천시 지역별 신재생에너지 발전량 비교 ({latest_year})', fontsize=24, pad=20, fontweight='bold')
     plt.xlabel('지역 (군·구)', fontsize=16, fontweight='bold')
     plt.ylabel('발전량 (MWh)', fontsize=16, fontweight='bold')
     plt.xticks(rotation=45, fontsize=14)
     plt.yticks(fontsize=14)
     plt.tight_layout()
-    plt.savefig('regional_comparison.png', dpi=300)
+    plt.savefig('regional_comparison.png', **SAVEFIG_OPTIONS)
     print("Saved regional_comparison.png")
 
-def plot_regional_source_breakdown(df):
-    latest_year = df['연도'].max()
-    df_latest = df[df['연도'] == latest_year]
-    
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
+def plot_regional_source_breakdown(regional_source, latest_year):
     # Stacked bar chart: x=Region, y=Generation, stack=Source
-    regional_source = df_latest.groupby('기초지자체')[value_cols].sum()
-    # Sort by total generation
-    regional_source['Total'] = regional_source.sum(axis=1)
-    regional_source = regional_source.sort_values('Total', ascending=False).drop(columns='Total')
+    # Sort by total generation (without mutating the shared frame)
+    order = regional_source.sum(axis=1).sort_values(ascending=False).index
+    regional_source = regional_source.loc[order]
     
-    plt.figure(figsize=(14, 8))
+    _new_figure((14, 8))
     # Use distinct colormap
-    regional_source.plot(kind='bar', stacked=True, colormap='tab20', width=0.8, figsize=(14, 8))
+    regional_source.plot(kind='bar', stacked=True, colormap='tab20', width=0.8, ax=plt.gca())
     plt.title(f'인천시 지역별/원별 신재생에너지 발전량 ({latest_year})', fontsize=24, pad=20, fontweight='bold')
     plt.xlabel('지역 (군·구)', fontsize=16, fontweight='bold')
     plt.ylabel('발전량 (MWh)', fontsize=16, fontweight='bold')
@@ -190,36 +249,34 @@ def plot_regional_source_breakdown(df):
     plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=14)
     plt.grid(axis='y', linestyle='--', alpha=0.5)
     plt.tight_layout()
-    plt.savefig('regional_source_breakdown.png', dpi=300)
+    plt.savefig('regional_source_breakdown.png', **SAVEFIG_OPTIONS)
     print("Saved regional_source_breakdown.png")
 
-def plot_energy_mix(df):
+def plot_energy_mix(regional_source, latest_year):
     # Total accumulation or Latest year
-    latest_year = df['연도'].max()
-    df_latest = df[df['연도'] == latest_year]
-    
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중'] # potential aggregate cols
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
-    total_mix = df_latest[value_cols].sum().sort_values(ascending=False)
+    total_mix = regional_source.to_numpy().sum(axis=0)
+    sources = regional_source.columns.to_numpy()
     
     # Filter out zero values
-    total_mix = total_mix[total_mix > 0]
+    positive = total_mix > 0
+    total_mix, sources = total_mix[positive], sources[positive]
     
     # Group small percentages into "Others" to prevent overlap
     threshold = 0.02 # 2%
-    total_sum = total_mix.sum()
-    mask = total_mix / total_sum >= threshold
+    mask = total_mix / total_mix.sum() >= threshold
     
     large_mix = total_mix[mask]
-    small_mix = total_mix[~mask]
+    labels = sources[mask].tolist()
     
-    if not small_mix.empty:
-        large_mix['기타 (Others)'] = small_mix.sum()
+    if not mask.all():
+        large_mix = np.append(large_mix, total_mix[~mask].sum())
+        labels.append('기타 (Others)')
     
-    large_mix = large_mix.sort_values(ascending=False)
+    order = np.argsort(-large_mix, kind='stable')
+    large_mix = large_mix[order]
+    labels = [labels[i] for i in order]
     
-    plt.figure(figsize=(14, 8))
+    _new_figure((14, 8))
     # Remove text labels from chart to fix overlapping
     wedges, texts, autotexts = plt.pie(
         large_mix, 
@@ -233,7 +290,7 @@ def plot_energy_mix(df):
     # Add Legend
     plt.legend(
         wedges, 
-        large_mix.index,
+        labels,
         title="에너지원",
         loc="center left",
         bbox_to_anchor=(1, 0, 0.5, 1),
@@ -244,22 +301,14 @@ def plot_energy_mix(df):
     plt.title(f'인천시 신재생에너지 원별 구성비 ({latest_year})', fontsize=24, fontweight='bold')
     plt.axis('equal')
     plt.tight_layout()
-    plt.savefig('energy_mix.png', dpi=300)
+    plt.savefig('energy_mix.png', **SAVEFIG_OPTIONS)
     print("Saved energy_mix.png")
 
-def plot_heatmap(df):
-    latest_year = df['연도'].max()
-    df_latest = df[df['연도'] == latest_year]
+def plot_heatmap(regional_source, latest_year):
+    # Region x Source sums
+    heatmap_data = regional_source.sort_index()
     
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
-    # Group by Region and Source
-    heatmap_data = df_latest.groupby('기초지자체')[value_cols].sum()
-    
-    plt.figure(figsize=(14, 10))
+    _new_figure((14, 10))
     sns.heatmap(heatmap_data, annot=True, fmt=',.0f', cmap='YlGnBu', annot_kws={"size": 12})
     plt.title(f'인천시 지역별/원별 발전량 히트맵 ({latest_year})', fontsize=24, pad=20, fontweight='bold')
     plt.xlabel('에너지원', fontsize=16, fontweight='bold')
@@ -267,22 +316,16 @@ def plot_heatmap(df):
     plt.xticks(fontsize=14)
     plt.yticks(fontsize=14)
     plt.tight_layout()
-    plt.savefig('heatmap.png', dpi=300)
+    plt.savefig('heatmap.png', **SAVEFIG_OPTIONS)
     print("Saved heatmap.png")
 
-def plot_yoy_growth(df):
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
-    yearly_total = df.groupby('연도')[value_cols].sum().sum(axis=1).sort_index()
+def plot_yoy_growth(yearly_total):
     growth_rate = yearly_total.pct_change() * 100
     
     # Drop NaN (first year)
     growth_rate = growth_rate.dropna()
     
-    plt.figure(figsize=(10, 6))
+    _new_figure((10, 6))
     if not growth_rate.empty:
         bars = plt.bar(growth_rate.index.astype(str), growth_rate.values, color='lightgreen')
         
@@ -293,112 +336,81 @@ def plot_yoy_growth(df):
         plt.yticks(fontsize=14)
         
         # Annotate
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                     f'{height:.1f}%',
-                     ha='center', va='bottom', fontsize=14, fontweight='bold')
+        plt.gca().bar_label(bars, labels=[f'{h:.1f}%' for h in growth_rate.values], fontsize=14, fontweight='bold')
         
         plt.axhline(0, color='black', linewidth=0.8)
         plt.grid(axis='y', linestyle='--', alpha=0.5)
         plt.tight_layout()
-        plt.savefig('yoy_growth.png', dpi=300)
+        plt.savefig('yoy_growth.png', **SAVEFIG_OPTIONS)
         print("Saved yoy_growth.png")
     else:
         print("Not enough data for YoY growth analysis.")
 
-def plot_top_solar_districts(df):
-    latest_year = df['연도'].max()
-    df_latest = df[df['연도'] == latest_year]
-    
+def plot_top_solar_districts(regional_source, latest_year):
     # Check if Solar exists (usually '태양광')
-    solar_col = [c for c in df.columns if '태양광' in c]
+    solar_col = [c for c in regional_source.columns if '태양광' in c]
     if not solar_col:
         print("Solar column not found.")
         return
     
     solar_col = solar_col[0]
     
-    top_districts = df_latest.groupby('기초지자체')[solar_col].sum().sort_values(ascending=False)
+    top_districts = regional_source[solar_col].sort_values(ascending=False)
     
-    plt.figure(figsize=(12, 6))
-    sns.barplot(x=top_districts.index, y=top_districts.values, palette='Oranges_r')
+    _new_figure((12, 6))
+    sns.barplot(x=top_districts.index, y=top_districts.values, order=top_districts.index, palette='Oranges_r')
     plt.title(f'인천시 태양광 발전 상위 지역 ({latest_year})', fontsize=24, pad=20, fontweight='bold')
     plt.xlabel('지역 (군·구)', fontsize=16, fontweight='bold')
     plt.ylabel('발전량 (MWh)', fontsize=16, fontweight='bold')
     plt.xticks(rotation=45, fontsize=14)
     plt.yticks(fontsize=14)
     plt.tight_layout()
-    plt.savefig('top_districts_solar.png', dpi=300)
+    plt.savefig('top_districts_solar.png', **SAVEFIG_OPTIONS)
     print("Saved top_districts_solar.png")
 
-def plot_solar_vs_others(df):
-    latest_year = df['연도'].max()
-    df_latest = df[df['연도'] == latest_year]
+def plot_solar_vs_others(regional_source, latest_year):
+    total_mix = regional_source.sum(axis=0)
     
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
-    total_mix = df_latest[value_cols].sum()
-    
-    solar_col = [c for c in df.columns if '태양광' in c]
+    solar_col = [c for c in regional_source.columns if '태양광' in c]
     if solar_col:
         solar_val = total_mix[solar_col[0]]
         others_val = total_mix.sum() - solar_val
         
-        plt.figure(figsize=(8, 8))
+        _new_figure((8, 8))
         plt.pie([solar_val, others_val], labels=['태양광 (Solar)', '기타 (Others)'], autopct='%1.1f%%', 
                 startangle=90, colors=['orange', 'lightgray'], textprops={'fontsize': 16, 'fontweight': 'bold'})
         plt.title(f'태양광 vs 기타 에너지 비중 ({latest_year})', fontsize=24, fontweight='bold')
         plt.tight_layout()
-        plt.savefig('solar_vs_others.png', dpi=300)
+        plt.savefig('solar_vs_others.png', **SAVEFIG_OPTIONS)
         print("Saved solar_vs_others.png")
 
 
-def export_dashboard_data(df):
+def export_dashboard_data(df, value_cols, yearly_source, yearly_total, latest_year):
     # Prepare data structures for Chart.js
     
-    # Exclude metadata AND aggregate columns to prevent double counting
-    # Exclude metadata AND aggregate columns to prevent double counting
-    exclude_cols = ['연도', '광역지자체', '기초지자체', '신재생에너지 합계', '재생에너지합계', '신에너지합계', '재생에너지 합계', '신에너지 합계', '합계', '소계', '지역별 공급비중']
-    value_cols = [c for c in df.columns if c not in exclude_cols]
-    
     # 1. Yearly Trend
-    yearly_df = df.groupby('연도')[value_cols].sum()
-    yearly_data = []
-    for year in yearly_df.index:
-        row = {"year": int(year)}
-        row.update(yearly_df.loc[year].to_dict())
-        yearly_data.append(row)
+    # to_dict(orient='records') builds the row dicts in one call and returns native Python scalars
+    yearly_data = yearly_source.reset_index().rename(columns={'연도': 'year'}).to_dict(orient='records')
         
     # 2. Regional Data (All Years)
-    years = sorted(df['연도'].unique())
+    # One groupby over (Year, Region) instead of filtering and grouping each year
+    regional_by_year = df.groupby(['연도', '기초지자체'], sort=False, observed=True)[value_cols].sum().sort_index()
     regional_data_by_year = {}
     
-    for year in years:
-        df_year = df[df['연도'] == year]
-        regional_df = df_year.groupby('기초지자체')[value_cols].sum()
-        regional_data = []
-        for region in regional_df.index:
-            row = {"region": region}
-            row.update(regional_df.loc[region].to_dict())
-            regional_data.append(row)
-        regional_data_by_year[int(year)] = regional_data
+    for year, regional_df in regional_by_year.groupby(level='연도', sort=False):
+        regional_df = regional_df.droplevel('연도')
+        regional_data_by_year[int(year)] = regional_df.reset_index().rename(columns={'기초지자체': 'region'}).to_dict(orient='records')
         
     # 3. Source List
     sources = value_cols
     
     # 4. YoY Growth Rate
-    yearly_total = df.groupby('연도')[value_cols].sum().sum(axis=1).sort_index()
     growth_rate = yearly_total.pct_change() * 100
     growth_data = []
     for year in growth_rate.index:
         if not pd.isna(growth_rate[year]):
-             growth_data.append({"year": int(year), "rate": round(growth_rate[year], 1)})
+             growth_data.append({"year": int(year), "rate": round(float(growth_rate[year]), 1)})
     
-    latest_year = df['연도'].max()
     dashboard_data = {
         "latest_year": int(latest_year),
         "yearly": yearly_data,
@@ -407,10 +419,20 @@ def export_dashboard_data(df):
         "growth_rate": growth_data
     }
     
-    with open("dashboard_data.json", "w", encoding='utf-8') as f:
-        json.dump(dashboard_data, f, ensure_ascii=False, indent=4)
+    if orjson is not None:
+        # orjson always writes UTF-8 and handles NumPy scalars / int keys natively
+        with open("dashboard_data.json", "wb") as f:
+            f.write(orjson.dumps(dashboard_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open("dashboard_data.json", "w", encoding='utf-8') as f:
+            # Same 2-space layout as orjson so the file does not depend on which is installed
+            json.dump(dashboard_data, f, ensure_ascii=False, indent=2)
     print("Saved dashboard_data.json")
 
+def _run_plot(plot_func, *args):
+    # Each plot draws on the shared figure from _new_figure, so nothing accumulates
+    plot_func(*args)
+
 def main():
     base_dir = r"c:\Users\User\Downloads\프로젝트"
     file_patterns = [os.path.join(base_dir, "202512190938_테스트*.CSV")]
@@ -419,7 +441,7 @@ def main():
     df = load_and_merge_data(file_patterns)
     
     print("Cleaning data...")
-    df_clean = clean_data(df)
+    df_clean, value_cols = clean_data(df)
     
     print(f"Filtered Data (Incheon): {df_clean.shape}")
     print(df_clean.head())
@@ -429,20 +451,50 @@ def main():
     
     print("Generating visualizations...")
     try:
-        plot_yearly_trend(df_clean)
-        plot_yearly_trend_by_source(df_clean) 
-        plot_regional_comparison(df_clean)
-        plot_regional_source_breakdown(df_clean) 
-        plot_energy_mix(df_clean)
+        # Shared aggregates: computed once and reused by every consumer
+        yearly_source = sum_by(df_clean, '연도', value_cols).sort_index()
+        # Row-sum of the small Year x Source frame; no second pass over df_clean
+        yearly_total = yearly_source.sum(axis=1)
+        # Latest year only for the regional / mix comparisons
+        latest_year = df_clean['연도'].max()
+        df_latest = df_clean.loc[df_clean['연도'] == latest_year].copy()
+        # Region x Source sums for the latest year, shared by the regional plots
+        regional_source = sum_by(df_latest, '기초지자체', value_cols)
         
-        # New Deep Analysis
-        plot_heatmap(df_clean)
-        plot_yoy_growth(df_clean)
-        plot_top_solar_districts(df_clean)
-        plot_solar_vs_others(df_clean)
+        plot_tasks = [
+            (plot_yearly_trend, yearly_total),
+            (plot_yearly_trend_by_source, yearly_source),
+            (plot_regional_comparison, regional_source, latest_year),
+            (plot_regional_source_breakdown, regional_source, latest_year),
+            (plot_energy_mix, regional_source, latest_year),
+            
+            # New Deep Analysis
+            (plot_heatmap, regional_source, latest_year),
+            (plot_yoy_growth, yearly_total),
+            (plot_top_solar_districts, regional_source, latest_year),
+            (plot_solar_vs_others, regional_source, latest_year),
+        ]
         
-        # Export for Web
-        export_dashboard_data(df_clean)
+        # Plots are independent and dominated by matplotlib rendering: one process each
+        max_workers = min(len(plot_tasks), os.cpu_count() or 1)
+        if max_workers == 1:
+            for task in plot_tasks:
+                _run_plot(*task)
+            
+            # Export for Web
+            export_dashboard_data(df_clean, value_cols, yearly_source, yearly_total, latest_year)
+        else:
+            # spawn, not fork: forking after numba has started its thread pool hangs on exit
+            mp_context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+                futures = [pool.submit(_run_plot, *task) for task in plot_tasks]
+                
+                # Export for Web (runs while the plots render)
+                export_dashboard_data(df_clean, value_cols, yearly_source, yearly_total, latest_year)
+                
+                # Re-raise any plotting error here
+                for future in futures:
+                    future.result()
         
     except Exception as e:
         print(f"Error during plotting: {e}")
@@ -450,7 +502,14 @@ def main():
         traceback.print_exc()
 
     # Save cleaned data
-    df_clean.to_csv("incheon_renewable_data_cleaned.csv", index=False, encoding='cp949') # cp949 for Excel compatibility in KR
+    # UTF-8 with BOM: Excel-KR opens it as readily as cp949, and Arrow's writer only emits UTF-8
+    if pyarrow is not None:
+        table = pyarrow.Table.from_pandas(df_clean, preserve_index=False)
+        with open("incheon_renewable_data_cleaned.csv", "wb") as f:
+            f.write('\ufeff'.encode('utf-8'))
+            pyarrow.csv.write_csv(table, f)
+    else:
+        df_clean.to_csv("incheon_renewable_data_cleaned.csv", index=False, encoding='utf-8-sig')
     print("Saved incheon_renewable_data_cleaned.csv")
 
 if __name__ == "__main__":